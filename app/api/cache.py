@@ -0,0 +1,254 @@
+"""In-process response cache for the dynamic table endpoints."""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import anyio
+
+from app.core.config import settings
+
+if TYPE_CHECKING:
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedResponse:
+    """A fully buffered successful response."""
+
+    headers: list[tuple[bytes, bytes]]
+    body: bytes
+    stored_at: float
+
+
+class ResponseCache:
+    """
+    Stale-while-revalidate store for GET responses of registered paths.
+
+    Entries younger than ``ttl`` are served as is. Older entries are still
+    served for another ``stale_ttl`` seconds while a background request
+    refreshes them; after that they count as missing.
+
+    The cache is bounded by entry count and by the total size of the cached
+    bodies. A single body larger than ``max_entry_bytes`` (by default a
+    sixteenth of ``max_bytes``) is not cached at all.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int | None = None,
+        max_entry_bytes: int | None = None,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = (
+            settings.table_cache_max_bytes if max_bytes is None else max_bytes
+        )
+        self.max_entry_bytes = (
+            self.max_bytes // 16 if max_entry_bytes is None else max_entry_bytes
+        )
+        self.paths: set[str] = set()
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._size = 0
+
+    def register_path(self, path: str) -> None:
+        """
+        Enable caching for a path.
+
+        Args:
+            path: Request path, e.g. ``/users``
+        """
+        self.paths.add(path)
+
+    def get(self, key: str) -> CachedResponse | None:
+        """
+        Get a cached response that is still within its stale window.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached response, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        max_age = settings.table_cache_ttl + settings.table_cache_stale_ttl
+        if time.monotonic() - entry.stored_at > max_age:
+            self.discard(key)
+            return None
+        return entry
+
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        """
+        Check whether an entry can be served without revalidation.
+
+        Args:
+            entry: Cached response
+
+        Returns:
+            True if the entry is younger than the TTL
+        """
+        return time.monotonic() - entry.stored_at <= settings.table_cache_ttl
+
+    def set(self, key: str, headers: list[tuple[bytes, bytes]], body: bytes) -> None:
+        """
+        Store a response, evicting the oldest entries when full.
+
+        A body over ``max_entry_bytes`` is not stored, and any older entry
+        for the key is dropped.
+
+        Args:
+            key: Cache key
+            headers: Raw response headers
+            body: Response body
+        """
+        self.discard(key)
+        if len(body) > self.max_entry_bytes:
+            return
+        self._entries[key] = CachedResponse(headers, body, time.monotonic())
+        self._size += len(body)
+        while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted.body)
+
+    def invalidate(self, path: str | None = None) -> None:
+        """
+        Drop cached responses.
+
+        Args:
+            path: Only drop responses for this path; drop everything if None
+        """
+        if path is None:
+            self._entries.clear()
+            self._size = 0
+            return
+        for key in [k for k in self._entries if k.partition("?")[0] == path]:
+            self.discard(key)
+
+    def discard(self, key: str) -> None:
+        """
+        Drop a cached response if present.
+
+        Args:
+            key: Cache key
+        """
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry.body)
+
+
+class ResponseCacheMiddleware:
+    """ASGI middleware serving registered GET paths from a ResponseCache."""
+
+    def __init__(self, app: "ASGIApp", cache: ResponseCache | None = None) -> None:
+        self.app = app
+        self.cache = cache if cache is not None else response_cache
+        self._refreshing: set[str] = set()
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def __call__(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or settings.table_cache_ttl <= 0
+            or scope["path"] not in self.cache.paths
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        key = self._cache_key(scope)
+        entry = self.cache.get(key)
+        if entry is None:
+            await self._call_and_store(key, scope, receive, send)
+            return
+
+        if not self.cache.is_fresh(entry) and key not in self._refreshing:
+            self._schedule_refresh(key, dict(scope))
+
+        await send(
+            {"type": "http.response.start", "status": 200, "headers": entry.headers}
+        )
+        await send({"type": "http.response.body", "body": entry.body})
+
+    @staticmethod
+    def _cache_key(scope: "Scope") -> str:
+        query = scope.get("query_string", b"").decode("latin-1")
+        if "&" in query:
+            # The order of different parameters does not change the
+            # response, so ?offset=0&limit=10 and ?limit=10&offset=0 share
+            # one entry. Sorting by name only is stable, keeping repeated
+            # parameters (where the last one wins) in their order.
+            query = "&".join(
+                sorted(query.split("&"), key=lambda part: part.partition("=")[0])
+            )
+        return f"{scope['path']}?{query}"
+
+    async def _call_and_store(
+        self, key: str, scope: "Scope", receive: "Receive", send: "Send"
+    ) -> None:
+        """Pass the request through, keeping a copy of a successful response."""
+        status = 0
+        headers: list[tuple[bytes, bytes]] = []
+        chunks: list[bytes] = []
+        size = 0
+
+        async def send_and_capture(message: "Message") -> None:
+            nonlocal status, headers, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = list(message.get("headers", []))
+            elif message["type"] == "http.response.body" and status == 200:
+                body = message.get("body", b"")
+                size += len(body)
+                if size > self.cache.max_entry_bytes:
+                    # Too large to cache; stop holding a copy of the stream
+                    # and drop the outdated entry it would have replaced
+                    status = 0
+                    chunks.clear()
+                    self.cache.discard(key)
+                else:
+                    chunks.append(body)
+                    if not message.get("more_body", False):
+                        self.cache.set(key, headers, b"".join(chunks))
+            await send(message)
+
+        await self.app(scope, receive, send_and_capture)
+
+    def _schedule_refresh(self, key: str, scope: "Scope") -> None:
+        """Re-run the request in the background to refresh a stale entry."""
+        self._refreshing.add(key)
+        task = asyncio.create_task(self._refresh(key, scope))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _refresh(self, key: str, scope: "Scope") -> None:
+        request_sent = False
+
+        async def receive() -> "Message":
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            # Nobody is listening; never report a disconnect
+            await anyio.sleep_forever()
+            raise AssertionError("unreachable")
+
+        async def discard(message: "Message") -> None:
+            return None
+
+        try:
+            await self._call_and_store(key, scope, receive, discard)
+        except Exception as e:
+            logger.warning("Error refreshing cached response for %s: %s", key, e)
+        finally:
+            self._refreshing.discard(key)
+
+
+# Global response cache instance
+response_cache = ResponseCache()
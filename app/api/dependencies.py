@@ -1,35 +1,61 @@
 """FastAPI dependencies."""
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator
 
-from mysql.connector.abstracts import MySQLConnectionAbstract
+import anyio
+from mysql.connector import Error
+from mysql.connector.errors import PoolError
 from mysql.connector.pooling import PooledMySQLConnection
 
-from app.core.database import get_db_connection, test_db_connection
-from app.core.exceptions import DatabaseConnectionError
+from app.core.database import (
+    acquire_delays,
+    checkout_connection,
+    test_db_connection,
+)
+from app.core.exceptions import DatabaseConnectionError, DatabaseUnavailableError
 
+__all__ = ["get_database_connection", "verify_database_health"]
 
-def get_database_connection() -> (
-    Generator[PooledMySQLConnection | MySQLConnectionAbstract, None, None]
-):
+
+async def get_database_connection() -> AsyncGenerator[PooledMySQLConnection, None]:
     """
-    FastAPI dependency to get database connection.
+    FastAPI dependency to get a pooled database connection.
+
+    While the pool is exhausted, checkout is retried with a short backoff
+    for up to ``db_acquire_timeout`` seconds. The connection is returned to
+    the pool once the request is finished.
 
     Returns:
         Database connection
 
     Raises:
+        DatabaseUnavailableError: If the pool stays exhausted past the timeout
         DatabaseConnectionError: If connection fails
     """
-    connection = get_db_connection()
-    if connection is None:
-        raise DatabaseConnectionError()
+    # Same schedule as acquire_connection, which sleeps in its thread
+    delays = acquire_delays()
+
+    while True:
+        try:
+            # Checkout may reconnect a stale connection, so keep it off the
+            # event loop
+            connection = await anyio.to_thread.run_sync(checkout_connection)
+            break
+        except PoolError as e:
+            delay = next(delays, None)
+            if delay is None:
+                raise DatabaseUnavailableError() from e
+            # Back off on the event loop rather than in a worker thread: the
+            # requests holding connections need the threads to finish
+            await anyio.sleep(delay)
+        except Error as e:
+            raise DatabaseConnectionError(f"Failed to connect to database: {e}") from e
 
     try:
         yield connection
     finally:
-        if connection and connection.is_connected():
-            connection.close()
+        # Without session reset, close() only re-queues the connection (no I/O)
+        connection.close()
 
 
 def verify_database_health() -> None:
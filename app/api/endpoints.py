@@ -1,20 +1,51 @@
 """Dynamic API endpoint generation."""
 
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import AsyncIterator, Callable
+from functools import partial
 from typing import TYPE_CHECKING, Any, Type, cast
 
+import anyio
 import mysql.connector
-from fastapi import Depends, FastAPI, HTTPException
-from pydantic import BaseModel
+from fastapi import Depends, FastAPI, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, ValidationError
+from pydantic_core import to_json
 
+from app.api.cache import response_cache
 from app.api.dependencies import get_database_connection
-from app.core.database import get_db_connection
-from app.core.exceptions import DatabaseConnectionError
+from app.core.config import settings
+from app.core.database import ping_database, quote_identifier
 from app.services.model_generator import model_generator
-from app.services.schema_extractor import SchemaExtractor
 
 if TYPE_CHECKING:
-    from mysql.connector.abstracts import MySQLConnectionAbstract
+    from mysql.connector.abstracts import MySQLConnectionAbstract, MySQLCursorAbstract
     from mysql.connector.pooling import PooledMySQLConnection
+    from pydantic import TypeAdapter
+
+__all__ = [
+    "HealthResponse",
+    "PageParams",
+    "TableCount",
+    "TableInfo",
+    "TablesResponse",
+    "add_health_endpoint",
+    "add_tables_info_endpoint",
+    "create_dynamic_endpoints",
+    "load_schema",
+]
+
+logger = logging.getLogger(__name__)
+
+# Seconds a /health database check result is reused
+_HEALTH_CHECK_INTERVAL = 1.0
+
+# Per-chunk cap on logged row validation errors, so a table full of bad
+# rows does not flood the log
+_MAX_LOGGED_VALIDATION_ERRORS = 5
 
 
 # Response models for API endpoints
@@ -42,31 +73,245 @@ class TablesResponse(BaseModel):
     tables: list[TableInfo]
 
 
+class TableCount(BaseModel):
+    """Table row count response model."""
+
+    table_name: str
+    estimated_rows: int | None
+
+
+class PageParams(BaseModel):
+    """Pagination query parameters shared by the table endpoints."""
+
+    limit: int = Field(
+        settings.page_size,
+        ge=1,
+        le=settings.max_page_size,
+        description="Rows to return",
+    )
+    offset: int = Field(0, ge=0, description="Rows to skip")
+
+
+# Schema information captured when the models are generated
+_schema_cache: dict[str, Any] = {}
+_schema_lock = threading.Lock()
+
+
+def load_schema() -> tuple[str, ...]:
+    """
+    Generate the table models once per process.
+
+    Later calls (a second app instance, tests, reloads) reuse the result.
+
+    Returns:
+        Names of the tables that have a generated model
+    """
+    with _schema_lock:
+        if "tables" not in _schema_cache:
+            # Models are keyed by table name, so the table list needs no
+            # second schema query; the schema is static after boot
+            models = model_generator.load_models()
+            _schema_cache["tables"] = tuple(models)
+    return cast(tuple[str, ...], _schema_cache["tables"])
+
+
 def create_dynamic_endpoints(app: FastAPI) -> None:
     """
     Create dynamic API endpoints for all database tables.
 
+    A table whose path is already taken by another route (e.g. a table
+    named ``health``) gets no endpoint. The tables that do have one are
+    recorded in ``app.state.tables`` for ``/tables``. Calling this again
+    for the same app does not register routes twice.
+
     Args:
         app: FastAPI application instance
     """
     try:
-        # Generate models from database schema
-        models = model_generator.generate_models_from_database()
-
-        # Get table names
-        with SchemaExtractor() as extractor:
-            table_names = extractor.get_table_names()
+        table_names = load_schema()
+        models = model_generator.get_all_models()
+        registered: list[str] = list(getattr(app.state, "tables", ()))
+        existing_paths = {getattr(route, "path", None) for route in app.router.routes}
 
         # Create endpoints for each table
         for table_name in table_names:
-            if table_name in models:
-                _create_table_endpoint(app, table_name, models[table_name])
-            else:
-                print(f"Warning: No model generated for table {table_name}")
+            if table_name in registered:
+                continue
+            if f"/{table_name}" in existing_paths:
+                logger.warning(
+                    "Skipping table %s: path /%s is already in use",
+                    table_name,
+                    table_name,
+                )
+                continue
+            _create_table_endpoint(app, table_name, models[table_name])
+            registered.append(table_name)
+
+        app.state.tables = tuple(registered)
 
     except Exception as e:
-        print(f"Error creating dynamic endpoints: {e}")
+        logger.error("Error creating dynamic endpoints: %s", e)
+        raise
+
+
+def _estimate_rows(
+    connection: "PooledMySQLConnection | MySQLConnectionAbstract", table_name: str
+) -> int | None:
+    """
+    Read the row count estimate MySQL keeps for a table.
+
+    This reads table statistics instead of scanning the table, so it is
+    approximate for InnoDB but does not grow with the table.
+
+    Args:
+        connection: Database connection
+        table_name: Name of the database table
+
+    Returns:
+        Estimated number of rows, or None if MySQL has no estimate
+    """
+    cursor = connection.cursor()
+    try:
+        cursor.execute(
+            "SELECT table_rows FROM information_schema.tables "
+            "WHERE table_schema = %s AND table_name = %s",
+            (settings.db_name, table_name),
+        )
+        # Cast to handle MySQL connector's complex return types
+        row = cast(tuple[Any, ...] | None, cursor.fetchone())
+    finally:
+        cursor.close()
+    if row is None or row[0] is None:
+        return None
+    return int(row[0])
+
+
+def _open_cursor(
+    connection: "PooledMySQLConnection | MySQLConnectionAbstract",
+    sql: str,
+    params: tuple[Any, ...],
+) -> "MySQLCursorAbstract":
+    """
+    Start an unbuffered query over the rows of a table.
+
+    Rows are left on the server side and read in chunks with ``fetchmany``,
+    as plain tuples: building a dict per row is left to the encoder.
+
+    Args:
+        connection: Database connection
+        sql: SELECT statement for the table
+        params: Values for the statement's placeholders
+
+    Returns:
+        Cursor positioned before the first row
+    """
+    cursor = connection.cursor(buffered=False)
+    try:
+        cursor.execute(sql, params)
+    except BaseException:
+        cursor.close()
         raise
+    return cursor
+
+
+def _encode_rows(
+    table_name: str,
+    model_class: type[BaseModel],
+    adapter: "TypeAdapter[list[dict[str, Any]]]",
+    columns: tuple[str, ...],
+    rows: list[tuple[Any, ...]],
+) -> bytes:
+    """
+    Validate rows against the table model and encode them as a JSON array.
+
+    Args:
+        table_name: Name of the database table
+        model_class: Pydantic model class for the table
+        adapter: List TypeAdapter for the table model
+        columns: Column names in the order they were selected
+        rows: Rows as tuples
+
+    Returns:
+        JSON array of the rows
+    """
+    records = [dict(zip(columns, row, strict=True)) for row in rows]
+
+    # Validate all rows in one pass; fall back to per-row validation
+    # only when some row does not match the model
+    try:
+        return adapter.dump_json(adapter.validate_python(records))
+    except ValidationError:
+        validated_results: list[BaseModel | dict[str, Any]] = []
+        invalid_count = 0
+        for result in records:
+            try:
+                validated_results.append(model_class.model_validate(result))
+            except ValidationError as validation_error:
+                invalid_count += 1
+                if invalid_count <= _MAX_LOGGED_VALIDATION_ERRORS:
+                    logger.warning(
+                        "Validation error for %s: %s", table_name, validation_error
+                    )
+                # Rows that do not match the model are returned unchanged
+                validated_results.append(result)
+
+        if invalid_count > _MAX_LOGGED_VALIDATION_ERRORS:
+            logger.warning(
+                "%d of %d rows in %s failed validation",
+                invalid_count,
+                len(records),
+                table_name,
+            )
+        return to_json(validated_results)
+
+
+def _close_cursor(cursor: "MySQLCursorAbstract") -> None:
+    """
+    Close a streaming cursor without raising.
+
+    A failure to close must not replace the error that ended the stream.
+
+    Args:
+        cursor: Cursor to close
+    """
+    try:
+        cursor.close()
+    except mysql.connector.Error as e:
+        logger.warning("Error closing table cursor: %s", e)
+
+
+async def _stream_rows(
+    cursor: "MySQLCursorAbstract",
+    encode: Callable[[list[tuple[Any, ...]]], bytes],
+) -> AsyncIterator[bytes]:
+    """
+    Stream the cursor's rows as one JSON array, ``chunk_size`` rows at a time.
+
+    Args:
+        cursor: Cursor with a pending result set
+        encode: Function encoding a chunk of rows as a JSON array
+
+    Yields:
+        Pieces of the JSON array
+    """
+
+    def read_chunk() -> bytes | None:
+        rows = cast(list[tuple[Any, ...]], cursor.fetchmany(settings.chunk_size))
+        return encode(rows) if rows else None
+
+    separator = b"["
+    try:
+        while (chunk := await anyio.to_thread.run_sync(read_chunk)) is not None:
+            # Splice the chunk's items into the outer array
+            yield separator + chunk[1:-1]
+            separator = b","
+    finally:
+        # Close even if the client went away: the pool is configured with
+        # consume_results, so this discards the unread rows
+        with anyio.CancelScope(shield=True):
+            await anyio.to_thread.run_sync(_close_cursor, cursor)
+
+    yield b"[]" if separator == b"[" else b"]"
 
 
 def _create_table_endpoint(
@@ -80,54 +325,58 @@ def _create_table_endpoint(
         table_name: Name of the database table
         model_class: Pydantic model class for the table
     """
+    # Everything that only depends on the table is built once here, so the
+    # request path does no formatting or lookups. These stay closure
+    # variables: default arguments would become query parameters.
+    # Select the model's columns explicitly so their positions are fixed
+    columns = tuple(model_class.model_fields)
+    select_list = ", ".join(quote_identifier(column) for column in columns)
+    sql = f"SELECT {select_list} FROM {quote_identifier(table_name)} LIMIT %s OFFSET %s"
+    encode = partial(
+        _encode_rows,
+        table_name,
+        model_class,
+        model_generator.get_adapter_for_table(table_name),
+        columns,
+    )
 
     async def get_table_data(
+        # One model for all query parameters: its validator is built once
+        # and shared by every table route instead of once per parameter
+        page: PageParams = Query(),
+        # Request scope keeps the connection checked out until the streamed
+        # response has been sent
         connection: "PooledMySQLConnection | MySQLConnectionAbstract" = Depends(
-            get_database_connection
+            get_database_connection, scope="request"
         ),
-    ) -> list[BaseModel]:
+    ) -> StreamingResponse:
         """
-        Get all data from the specified table.
+        Get a page of data from the specified table.
+
+        Args:
+            page: Number of rows to return and to skip
 
         Returns:
-            List of table records
+            Streaming JSON response with the table records
         """
         try:
-            cursor = connection.cursor(dictionary=True)
-            cursor.execute(f"SELECT * FROM {table_name}")
-            results = cursor.fetchall()
-            cursor.close()
-
-            # Cast to handle MySQL connector's complex return types
-            raw_results = cast(list[dict[str, Any]], results)
-
-            # Validate data against the model and return model instances
-            validated_results = []
-            for result in raw_results:
-                try:
-                    # Create model instance to validate data
-                    validated_item = model_class(**result)
-                    validated_results.append(validated_item)
-                except Exception as validation_error:
-                    print(f"Validation error for {table_name}: {validation_error}")
-                    # For invalid data, create a simple BaseModel instance with the raw data
-                    # This avoids the create_model type checking issues while maintaining functionality
-                    class GenericModel(BaseModel):
-                        class Config:
-                            extra = "allow"
-                    
-                    validated_results.append(GenericModel(**result))
-
-            return validated_results
-
+            cursor = await anyio.to_thread.run_sync(
+                _open_cursor, connection, sql, (page.limit, page.offset)
+            )
         except mysql.connector.Error as e:
             raise HTTPException(status_code=500, detail=f"Database error: {e}") from e
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Unexpected error: {e}") from e
 
+        # Returning a Response skips FastAPI's response validation and
+        # jsonable_encoder pass; response_model is kept for the docs only
+        return StreamingResponse(
+            _stream_rows(cursor, encode), media_type="application/json"
+        )
+
     # Set function metadata for better API documentation
     get_table_data.__name__ = f"get_{table_name}_data"
-    get_table_data.__doc__ = f"Get all records from the {table_name} table"
+    get_table_data.__doc__ = f"Get a page of records from the {table_name} table"
 
     # Add the route to the app
     app.add_api_route(
@@ -136,9 +385,43 @@ def _create_table_endpoint(
         methods=["GET"],
         response_model=list[model_class],  # type: ignore[valid-type]
         tags=[table_name],
-        summary=f"Get all {table_name} records",
-        description=f"Retrieve all records from the {table_name} table",
+        summary=f"Get {table_name} records",
+        description=f"Retrieve a page of records from the {table_name} table",
+    )
+    response_cache.register_path(f"/{table_name}")
+
+    async def get_table_count(
+        connection: "PooledMySQLConnection | MySQLConnectionAbstract" = Depends(
+            get_database_connection
+        ),
+    ) -> TableCount:
+        """
+        Get the estimated number of rows in the specified table.
+
+        Returns:
+            Table name and row count estimate
+        """
+        try:
+            estimated_rows = await anyio.to_thread.run_sync(
+                _estimate_rows, connection, table_name
+            )
+        except mysql.connector.Error as e:
+            raise HTTPException(status_code=500, detail=f"Database error: {e}") from e
+        return TableCount(table_name=table_name, estimated_rows=estimated_rows)
+
+    get_table_count.__name__ = f"get_{table_name}_count"
+
+    app.add_api_route(
+        path=f"/{table_name}/count",
+        endpoint=get_table_count,
+        methods=["GET"],
+        response_model=TableCount,
+        tags=[table_name],
+        summary=f"Count {table_name} records",
+        description=f"Estimated number of records in the {table_name} table, "
+        "from table statistics (no table scan)",
     )
+    response_cache.register_path(f"/{table_name}/count")
 
 
 def add_health_endpoint(app: FastAPI) -> None:
@@ -148,18 +431,30 @@ def add_health_endpoint(app: FastAPI) -> None:
     Args:
         app: FastAPI application instance
     """
+    # Probes from several sources share one database check per interval
+    lock = asyncio.Lock()
+    last_check: dict[str, Any] = {"at": float("-inf"), "error": None}
+
+    async def check_database() -> None:
+        async with lock:
+            if time.monotonic() - last_check["at"] >= _HEALTH_CHECK_INTERVAL:
+                try:
+                    await anyio.to_thread.run_sync(ping_database)
+                    last_check["error"] = None
+                except Exception as e:
+                    last_check["error"] = e
+                last_check["at"] = time.monotonic()
+        if last_check["error"] is not None:
+            raise last_check["error"]
 
     @app.get("/health", tags=["health"], response_model=HealthResponse)
     async def health_check() -> HealthResponse:
         """Health check endpoint."""
+        if not getattr(app.state, "ready", True):
+            raise HTTPException(status_code=503, detail="Service starting")
         try:
             # Test database connection
-            connection = get_db_connection()
-            if connection is None:
-                raise DatabaseConnectionError()
-
-            connection.ping(reconnect=True)
-            connection.close()
+            await check_database()
 
             return HealthResponse(
                 status="healthy",
@@ -185,9 +480,8 @@ def add_tables_info_endpoint(app: FastAPI) -> None:
     async def get_tables_info() -> TablesResponse:
         """Get information about available tables and their models."""
         try:
-            with SchemaExtractor() as extractor:
-                table_names = extractor.get_table_names()
-
+            # Only the tables that got an endpoint, not every loaded model
+            table_names: tuple[str, ...] = getattr(app.state, "tables", ())
             models = model_generator.get_all_models()
 
             tables_info = []
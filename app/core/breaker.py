@@ -0,0 +1,59 @@
+"""Circuit breaker for database connection attempts."""
+
+import threading
+import time
+
+
+class CircuitBreaker:
+    """
+    Fail fast after repeated connection failures.
+
+    The breaker opens after ``failure_threshold`` consecutive failures and
+    then rejects attempts for ``reset_timeout`` seconds. After that a single
+    probe attempt is let through (half-open): success closes the breaker,
+    failure opens it again.
+
+    Every allowed attempt must be followed by ``record_success`` or
+    ``record_failure``.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """
+        Check whether an attempt may be made now.
+
+        Returns:
+            True if the caller should attempt the operation
+        """
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if (
+                self.state == "open"
+                and time.monotonic() - self.opened_at >= self.reset_timeout
+            ):
+                self.state = "half_open"
+                return True
+            # Open, or half-open with the probe still in flight
+            return False
+
+    def record_success(self) -> None:
+        """Record a successful attempt, closing the breaker."""
+        with self._lock:
+            self.state = "closed"
+            self.failures = 0
+
+    def record_failure(self) -> None:
+        """Record a failed attempt, opening the breaker at the threshold."""
+        with self._lock:
+            self.failures += 1
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                self.state = "open"
+                self.opened_at = time.monotonic()
@@ -1,5 +1,7 @@
 """Configuration management using Pydantic Settings."""
 
+from functools import cached_property
+from typing import Literal
 
 from pydantic_settings import BaseSettings
 
@@ -13,23 +15,37 @@ class Settings(BaseSettings):
     db_user: str = "root"
     db_password: str = "password"
     db_name: str = "example"
+    db_pool_name: str = "app_pool"
+    db_pool_size: int = 10
+    db_acquire_timeout: float = 2.0  # seconds to wait for a free pooled connection
+    db_breaker_threshold: int = 5  # consecutive failures before failing fast
+    db_breaker_reset_timeout: float = 30.0  # seconds before trying again
 
     # API configuration
     excluded_tables: str = ""
+    chunk_size: int = 1000  # rows fetched per round trip when streaming tables
+    page_size: int = 1000  # rows returned by a table endpoint without ?limit=
+    max_page_size: int = 10000  # largest ?limit= a table endpoint accepts
+    schema_cache_path: str = ""  # file caching introspected columns, "" disables
+    # "live" introspects the database, "module" imports app/models/tables.py,
+    # "cache" reads schema_cache_path without checking it against the database
+    schema_source: Literal["live", "module", "cache"] = "live"
+    table_cache_ttl: float = 5.0  # seconds a table response is served as fresh
+    table_cache_stale_ttl: float = 60.0  # extra seconds served while refreshing
+    table_cache_max_bytes: int = 64 * 1024 * 1024  # total cached body bytes
 
     # FastAPI configuration
     title: str = "Dynamic Database API"
     description: str = "Automatically generated REST API for database tables"
     version: str = "1.0.0"
+    log_level: str = "INFO"
 
-    @property
-    def excluded_tables_list(self) -> list[str]:
-        """Get excluded tables as a list."""
-        if not self.excluded_tables:
-            return []
-        return [
+    @cached_property
+    def excluded_tables_set(self) -> frozenset[str]:
+        """Get excluded tables as a set, parsed once."""
+        return frozenset(
             table.strip() for table in self.excluded_tables.split(",") if table.strip()
-        ]
+        )
 
     class Config:
         env_file = ".env"
@@ -1,52 +1,294 @@
 """Database connection and utilities."""
 
+import logging
+import socket
+import threading
 import time
+from collections.abc import Iterator
 
-import mysql.connector
 from mysql.connector import Error
-from mysql.connector.abstracts import MySQLConnectionAbstract
-from mysql.connector.pooling import PooledMySQLConnection
+from mysql.connector.errors import PoolError
+from mysql.connector.pooling import MySQLConnectionPool, PooledMySQLConnection
 
+from app.core.breaker import CircuitBreaker
 from app.core.config import settings
+from app.core.exceptions import DatabaseConnectionError, DatabaseUnavailableError
+
+logger = logging.getLogger(__name__)
+
+# The pool opens all of its connections on construction, so it is created
+# lazily on first use rather than at import time (the database may not be
+# reachable yet when the application module is imported).
+_pool: MySQLConnectionPool | None = None
+_pool_lock = threading.Lock()
+
+# Fails connection attempts fast while the database keeps refusing them
+_breaker = CircuitBreaker(
+    settings.db_breaker_threshold, settings.db_breaker_reset_timeout
+)
+
+
+def quote_identifier(name: str) -> str:
+    """
+    Quote a MySQL identifier such as a table name.
+
+    Args:
+        name: Unquoted identifier
+
+    Returns:
+        Backtick-quoted identifier with embedded backticks escaped
+    """
+    return "`" + name.replace("`", "``") + "`"
+
+
+def get_pool() -> MySQLConnectionPool:
+    """
+    Return the shared MySQL connection pool, creating it on first use.
+
+    Returns:
+        MySQL connection pool
+
+    Raises:
+        Error: If the pool cannot be created
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = MySQLConnectionPool(
+                    pool_name=settings.db_pool_name,
+                    pool_size=settings.db_pool_size,
+                    # Connections are autocommit and read-only; skip the
+                    # COM_RESET_CONNECTION round trip on every checkin.
+                    pool_reset_session=False,
+                    host=settings.db_host,
+                    port=settings.db_port,
+                    user=settings.db_user,
+                    password=settings.db_password,
+                    database=settings.db_name,
+                    connection_timeout=10,
+                    autocommit=True,
+                    # Closing a cursor with unread rows (a client that went
+                    # away mid-stream) reads and discards them instead of
+                    # raising, so the connection goes back to the pool clean
+                    consume_results=True,
+                )
+    return _pool
+
+
+def checkout_connection() -> PooledMySQLConnection:
+    """
+    Check out a pooled connection through the circuit breaker.
+
+    Returns:
+        Pooled MySQL connection object
+
+    Raises:
+        DatabaseUnavailableError: If the breaker is open after repeated failures
+        PoolError: If the pool is exhausted
+        Error: If the database cannot be reached
+    """
+    if not _breaker.allow():
+        raise DatabaseUnavailableError("Database unavailable, not retrying yet")
+    try:
+        connection = get_pool().get_connection()
+    except PoolError:
+        # Every connection is busy, which says nothing bad about the server
+        _breaker.record_success()
+        raise
+    except BaseException:
+        # Any other failure (not only mysql errors) must settle the attempt,
+        # or a failed half-open probe would leave the breaker stuck
+        _breaker.record_failure()
+        raise
+    _breaker.record_success()
+    return connection
+
+
+def backoff_delays(
+    first: float, limit: float, factor: float = 2.0, timeout: float | None = None
+) -> Iterator[float]:
+    """
+    Yield exponentially growing delays between retry attempts.
+
+    Args:
+        first: First delay in seconds
+        limit: Largest delay in seconds
+        factor: Growth factor from one delay to the next
+        timeout: Overall time budget in seconds from now; delays are cut to
+            the remaining budget and stop once it is spent. None never stops.
+
+    Returns:
+        Iterator of delays in seconds
+    """
+    # Taken now rather than on the first next() call
+    deadline = None if timeout is None else time.monotonic() + timeout
+
+    def delays() -> Iterator[float]:
+        delay = first
+        while True:
+            if deadline is None:
+                yield delay
+            else:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                yield min(delay, remaining)
+            delay = min(delay * factor, limit)
+
+    return delays()
+
+
+def acquire_delays(timeout: float | None = None) -> Iterator[float]:
+    """
+    Yield the delays between checkout attempts while the pool is exhausted.
+
+    Args:
+        timeout: Seconds to wait for a free connection, defaults to the
+            ``db_acquire_timeout`` setting
+
+    Returns:
+        Iterator of delays, ending when the timeout is spent
+    """
+    if timeout is None:
+        timeout = settings.db_acquire_timeout
+    return backoff_delays(0.005, 0.1, timeout=timeout)
+
+
+def acquire_connection(timeout: float | None = None) -> PooledMySQLConnection:
+    """
+    Check out a pooled connection, waiting at most ``timeout`` seconds.
+
+    The mysql.connector pool raises immediately when it is exhausted, so the
+    checkout is retried with a short backoff until the deadline passes.
+
+    Args:
+        timeout: Seconds to wait for a free connection, defaults to the
+            ``db_acquire_timeout`` setting
+
+    Returns:
+        Pooled MySQL connection object
+
+    Raises:
+        DatabaseUnavailableError: If no connection is freed before the deadline,
+            or connection attempts are suspended after repeated failures
+        DatabaseConnectionError: If the database cannot be reached
+    """
+    delays = acquire_delays(timeout)
+
+    while True:
+        try:
+            return checkout_connection()
+        except PoolError as e:
+            delay = next(delays, None)
+            if delay is None:
+                raise DatabaseUnavailableError() from e
+            time.sleep(delay)
+        except Error as e:
+            raise DatabaseConnectionError(f"Failed to connect to database: {e}") from e
+
+
+def ping_database() -> None:
+    """
+    Check that the database answers, using a pooled connection.
+
+    Checking a connection out already pings it (and reconnects if needed),
+    so no separate ping or new connection handshake is required.
+
+    Raises:
+        DatabaseUnavailableError: If the pool stays exhausted past the timeout
+        DatabaseConnectionError: If the database cannot be reached
+    """
+    acquire_connection().close()
+
+
+def warm_pool() -> None:
+    """
+    Open and validate every pooled connection ahead of the first request.
+
+    Connections are checked out one at a time, run ``SELECT 1`` and go
+    straight back to the pool, so warming never holds more than one of
+    them and can run while other code uses the pool.
+
+    Raises:
+        Error: If a connection cannot be established
+    """
+    pool = get_pool()
+    for _ in range(pool.pool_size):
+        try:
+            connection = pool.get_connection()
+        except PoolError:
+            # The remaining connections are checked out, so already in use
+            break
+        try:
+            cursor = connection.cursor()
+            cursor.execute("SELECT 1")
+            cursor.fetchall()
+            cursor.close()
+        finally:
+            # The pool is a FIFO queue, so the next checkout gets the next one
+            connection.close()
 
 
 def get_db_connection(
     max_retries: int = 5, retry_delay: int = 2
-) -> PooledMySQLConnection | MySQLConnectionAbstract | None:
+) -> PooledMySQLConnection | None:
     """
-    Create and return a MySQL database connection with retry logic.
+    Check out a connection from the pool with retry logic.
+
+    Calling ``close()`` on the returned connection hands it back to the pool
+    instead of tearing down the socket.
 
     Args:
         max_retries: Maximum number of connection attempts
         retry_delay: Delay between retry attempts in seconds
 
     Returns:
-        MySQL connection object or None if connection fails
+        Pooled MySQL connection object or None if connection fails
     """
     for attempt in range(max_retries):
         try:
-            connection = mysql.connector.connect(
-                host=settings.db_host,
-                port=settings.db_port,
-                user=settings.db_user,
-                password=settings.db_password,
-                database=settings.db_name,
-                connection_timeout=10,
-                autocommit=True,
+            # An exhausted pool is waited on briefly rather than retried
+            # here: it says nothing about the database being down
+            return acquire_connection()
+        except DatabaseUnavailableError as e:
+            logger.warning("Database connection skipped: %s", e.detail)
+            return None
+        except DatabaseConnectionError as e:
+            logger.warning(
+                "Database connection attempt %d failed: %s", attempt + 1, e.detail
             )
-            print(f"Successfully connected to database on attempt {attempt + 1}")
-            return connection
-        except Error as e:
-            print(f"Database connection attempt {attempt + 1} failed: {e}")
             if attempt < max_retries - 1:
-                print(f"Retrying in {retry_delay} seconds...")
+                logger.info("Retrying in %s seconds...", retry_delay)
                 time.sleep(retry_delay)
             else:
-                print(f"Failed to connect to database after {max_retries} attempts")
+                logger.error(
+                    "Failed to connect to database after %d attempts", max_retries
+                )
 
     return None
 
 
+def is_port_open(timeout: float = 1.0) -> bool:
+    """
+    Check whether the database server accepts TCP connections.
+
+    This is much cheaper than a MySQL handshake, so it is used to skip
+    connection attempts while the server is still starting.
+
+    Args:
+        timeout: Seconds to wait for the TCP connection
+
+    Returns:
+        True if the port accepts connections, False otherwise
+    """
+    try:
+        socket.create_connection((settings.db_host, settings.db_port), timeout).close()
+    except OSError:
+        return False
+    return True
+
+
 def test_db_connection() -> bool:
     """
     Test database connection.
@@ -54,40 +296,69 @@ def test_db_connection() -> bool:
     Returns:
         True if connection successful, False otherwise
     """
-    connection = get_db_connection()
+    connection = get_db_connection(max_retries=1)
     if connection is None:
         return False
 
-    try:
-        connection.ping(reconnect=True)
-        return True
-    except Error:
-        return False
-    finally:
-        if connection and connection.is_connected():
-            connection.close()
+    # Checking a connection out of the pool already pinged it
+    connection.close()
+    return True
+
+
+def database_available() -> bool:
+    """
+    Check once whether the database accepts connections.
+
+    The cheap TCP probe runs first, so no handshake is attempted while the
+    server is still starting.
+
+    Returns:
+        True if a connection could be checked out, False otherwise
+    """
+    return is_port_open() and test_db_connection()
+
+
+def wait_delays(timeout: float | None = None) -> Iterator[float]:
+    """
+    Yield the delays between attempts while waiting for the database.
+
+    Attempts back off exponentially from 0.1 s up to 5 s.
+
+    Args:
+        timeout: Overall seconds to wait, or None to wait indefinitely
+
+    Returns:
+        Iterator of delays, ending when the timeout is spent
+    """
+    return backoff_delays(0.1, 5.0, factor=1.5, timeout=timeout)
 
 
 def wait_for_db(max_wait_time: int = 60) -> bool:
     """
     Wait for database to become available.
 
+    Attempts are spaced by ``wait_delays``.
+
     Args:
         max_wait_time: Maximum time to wait in seconds
 
     Returns:
         True if database becomes available, False if timeout
     """
-    print("Waiting for database to become available...")
-    start_time = time.time()
+    logger.info("Waiting for database to become available...")
+    delays = wait_delays(max_wait_time)
 
-    while time.time() - start_time < max_wait_time:
-        if test_db_connection():
-            print("Database is now available!")
+    while True:
+        if database_available():
+            logger.info("Database is now available!")
             return True
 
-        print("Database not ready, waiting...")
-        time.sleep(2)
+        delay = next(delays, None)
+        if delay is None:
+            break
+
+        logger.info("Database not ready, waiting...")
+        time.sleep(delay)
 
-    print(f"Database did not become available within {max_wait_time} seconds")
+    logger.warning("Database did not become available within %s seconds", max_wait_time)
     return False
@@ -10,6 +10,13 @@ class DatabaseConnectionError(HTTPException):
         super().__init__(status_code=500, detail=detail)
 
 
+class DatabaseUnavailableError(HTTPException):
+    """Raised when no database connection becomes available in time."""
+
+    def __init__(self, detail: str = "Database connection pool exhausted"):
+        super().__init__(status_code=503, detail=detail)
+
+
 class TableNotFoundError(HTTPException):
     """Raised when a requested table is not found."""
 
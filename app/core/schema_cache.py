@@ -0,0 +1,74 @@
+"""On-disk cache of introspected table columns."""
+
+import json
+import logging
+import os
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Bumped whenever the layout of the cached columns changes
+_FORMAT = 2
+
+
+def load(path: str, fingerprint: str | None) -> dict[str, list[list[Any]]] | None:
+    """
+    Load cached table columns if they were saved for the same schema.
+
+    Args:
+        path: Cache file path
+        fingerprint: Fingerprint of the current database schema, or None to
+            accept the cache whatever schema it was saved for
+
+    Returns:
+        Dictionary mapping table names to column rows, or None if the file is
+        missing, unreadable, in an older format or written for another schema
+    """
+    try:
+        payload = json.loads(Path(path).read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring unreadable schema cache %s: %s", path, e)
+        return None
+
+    if (
+        not isinstance(payload, dict)
+        or payload.get("format") != _FORMAT
+        or (fingerprint is not None and payload.get("fingerprint") != fingerprint)
+    ):
+        return None
+    tables: dict[str, list[list[Any]]] = payload["tables"]
+    return tables
+
+
+def save(
+    path: str, fingerprint: str, tables: Mapping[str, Sequence[Sequence[Any]]]
+) -> None:
+    """
+    Save table columns for a schema fingerprint.
+
+    The file is replaced atomically, so concurrent workers never read a
+    partially written cache. Failures are logged, not raised: the cache is
+    only an optimization.
+
+    Args:
+        path: Cache file path
+        fingerprint: Fingerprint of the database schema
+        tables: Dictionary mapping table names to column rows
+    """
+    target = Path(path)
+    temp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    try:
+        temp.write_text(
+            json.dumps(
+                {"format": _FORMAT, "fingerprint": fingerprint, "tables": tables},
+                default=str,
+            )
+        )
+        temp.replace(target)
+    except OSError as e:
+        logger.warning("Could not write schema cache %s: %s", path, e)
+        temp.unlink(missing_ok=True)
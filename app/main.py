@@ -1,15 +1,113 @@
 """Main FastAPI application."""
 
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from mysql.connector import Error
 
+from app.api.cache import ResponseCacheMiddleware
 from app.api.endpoints import (
     add_health_endpoint,
     add_tables_info_endpoint,
     create_dynamic_endpoints,
+    load_schema,
 )
 from app.core.config import settings
-from app.core.database import wait_for_db
+from app.core.database import database_available, wait_delays, warm_pool
+
+logger = logging.getLogger(__name__)
+
+
+async def _warm_pool() -> None:
+    """Warm the connection pool in a worker thread, reporting failures."""
+    try:
+        await asyncio.to_thread(warm_pool)
+        logger.info("Database connection pool warmed")
+    except Error as e:
+        logger.warning("Could not warm database connection pool: %s", e)
+
+
+async def _load_schema() -> Exception | None:
+    """Load the table models in a worker thread, returning the error if any."""
+    try:
+        await asyncio.to_thread(load_schema)
+    except Exception as e:
+        return e
+    return None
+
+
+def _add_table_endpoints(app: FastAPI, schema_error: Exception | None) -> None:
+    """Register the table endpoints unless loading the schema failed."""
+    try:
+        if schema_error is not None:
+            raise schema_error
+        create_dynamic_endpoints(app)
+        logger.info("Dynamic endpoints created successfully")
+    except Exception as e:
+        logger.error("Error creating dynamic endpoints: %s", e)
+        # Continue without dynamic endpoints - health check will still work
+
+
+async def _prepare_live(app: FastAPI) -> None:
+    """
+    Wait for the database, then load the schema and add the table endpoints.
+
+    Args:
+        app: FastAPI application instance
+    """
+    logger.info("Waiting for database connection...")
+    # Keep waiting however long the database takes, so the endpoints are
+    # added (and /health turns healthy) as soon as it comes up. Each worker
+    # thread hop is a single probe and the waits happen on the event loop,
+    # so cancelling the task at shutdown takes effect promptly.
+    delays = wait_delays()
+    while not await asyncio.to_thread(database_available):
+        logger.info("Database not ready, waiting...")
+        await asyncio.sleep(next(delays))
+    logger.info("Database is now available!")
+
+    # Warming the pool and reading the schema are independent, so they
+    # run side by side instead of paying for both round trips in turn
+    _, schema_error = await asyncio.gather(_warm_pool(), _load_schema())
+    _add_table_endpoints(app, schema_error)
+    app.state.ready = True
+
+
+def _log_task_failure(task: "asyncio.Task[None]") -> None:
+    """Log the exception of a failed background startup task."""
+    if not task.cancelled() and (error := task.exception()) is not None:
+        logger.error("Background startup task failed", exc_info=error)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Prepare the database pool and table endpoints.
+
+    Unless ``schema_source`` is ``live``, the table models come from files,
+    so the endpoints are registered without waiting for the database.
+    Otherwise the server starts at once and the endpoints are added in the
+    background whenever the database comes up; ``/health`` reports 503
+    until then.
+
+    Args:
+        app: FastAPI application instance
+    """
+    if settings.schema_source != "live":
+        _add_table_endpoints(app, await _load_schema())
+        app.state.ready = True
+        # Requests connect on demand; warming only saves their handshakes
+        task = asyncio.create_task(_warm_pool())
+    else:
+        task = asyncio.create_task(_prepare_live(app))
+    # Nothing awaits the task, so report its failure here
+    task.add_done_callback(_log_task_failure)
+    yield
+    task.cancel()
 
 
 def create_app() -> FastAPI:
@@ -19,13 +117,24 @@ def create_app() -> FastAPI:
     Returns:
         Configured FastAPI application instance
     """
+    logging.basicConfig(level=settings.log_level.upper())
+
+    # No default_response_class: with the default, FastAPI serializes
+    # response models straight to JSON bytes with Pydantic's Rust core,
+    # skipping jsonable_encoder (a custom class disables that fast path)
     app = FastAPI(
         title=settings.title,
         description=settings.description,
         version=settings.version,
         docs_url="/docs",
         redoc_url="/redoc",
+        lifespan=lifespan,
     )
+    # Set by the lifespan once the table endpoints are in place
+    app.state.ready = False
+
+    # Serve repeated table reads from memory (added first so CORS wraps it)
+    app.add_middleware(ResponseCacheMiddleware)
 
     # Add CORS middleware
     app.add_middleware(
@@ -42,18 +151,6 @@ def create_app() -> FastAPI:
     # Add tables info endpoint
     add_tables_info_endpoint(app)
 
-    # Wait for database to be available before creating dynamic endpoints
-    print("Waiting for database connection...")
-    if wait_for_db(max_wait_time=60):
-        try:
-            create_dynamic_endpoints(app)
-            print("Dynamic endpoints created successfully")
-        except Exception as e:
-            print(f"Error creating dynamic endpoints: {e}")
-            # Continue without dynamic endpoints - health check will still work
-    else:
-        print("Database not available - starting without dynamic endpoints")
-
     return app
 
 
@@ -64,4 +161,7 @@ app = create_app()
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
+    # No reloader outside development (use ``make run-local`` for that).
+    # uvicorn picks uvloop and httptools when installed, and runs
+    # WEB_CONCURRENCY worker processes when that variable is set.
+    uvicorn.run("app.main:app", host="0.0.0.0", port=8000)
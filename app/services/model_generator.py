@@ -1,12 +1,121 @@
 """Pydantic model generation using database schema introspection."""
 
+import importlib
+import keyword
 import re
-from typing import Any, cast
+from functools import lru_cache
+from pathlib import Path
+from types import NoneType, UnionType
+from typing import Annotated, Any, Union, cast, get_args, get_origin
 
-from pydantic import BaseModel, Field, create_model
+from annotated_types import MaxLen
+from pydantic import BaseModel, Field, TypeAdapter, create_model
+from typing_extensions import TypedDict
 
+from app.core import schema_cache
+from app.core.config import settings
 from app.core.exceptions import ModelGenerationError
-from app.services.schema_extractor import SchemaExtractor
+from app.services.schema_extractor import ColumnInfo, SchemaExtractor
+
+# Module written by ModelGenerator.write_precompiled_models
+PRECOMPILED_MODELS_MODULE = "app.models.tables"
+
+# Length of a varchar(n) column type
+_VARCHAR_RE = re.compile(r"varchar\((\d+)\)")
+
+# Python types by MySQL type name
+_MYSQL_TYPES: dict[str, type[Any]] = {
+    # Integer types
+    "tinyint": int,
+    "smallint": int,
+    "mediumint": int,
+    "int": int,
+    "integer": int,
+    "bigint": int,
+    # Float types
+    "float": float,
+    "double": float,
+    "decimal": float,
+    "numeric": float,
+    # String types
+    "char": str,
+    "varchar": str,
+    "tinytext": str,
+    "text": str,
+    "mediumtext": str,
+    "longtext": str,
+    # Date/time types, handled as strings for simplicity
+    "date": str,
+    "time": str,
+    "datetime": str,
+    "timestamp": str,
+    # Boolean type
+    "bool": bool,
+    "boolean": bool,
+    # JSON type
+    "json": dict,
+    # Binary types
+    "binary": bytes,
+    "varbinary": bytes,
+    "tinyblob": bytes,
+    "blob": bytes,
+    "mediumblob": bytes,
+    "longblob": bytes,
+}
+
+
+@lru_cache(maxsize=512)
+def _map_mysql_type(mysql_type_lower: str, is_nullable: bool) -> Any:
+    """
+    Map a lowercased MySQL column type to a Python type.
+
+    Cached because the same few column types repeat across every table.
+
+    Args:
+        mysql_type_lower: Lowercased MySQL column type string
+        is_nullable: Whether the column is nullable
+
+    Returns:
+        Python type, or a union with None if nullable
+    """
+    # The type name is the leading token, e.g. "int" in "int(11) unsigned"
+    type_name = mysql_type_lower.split("(", 1)[0].split(" ", 1)[0]
+
+    # Special case for tinyint(1) which is often used as boolean
+    if type_name == "tinyint" and mysql_type_lower.startswith("tinyint(1)"):
+        base_type: type[Any] = bool
+    else:
+        # Default to string for unknown types
+        base_type = _MYSQL_TYPES.get(type_name, str)
+
+    # Make optional if nullable
+    if is_nullable:
+        return base_type | None
+    return base_type
+
+
+def _is_plain_identifier(name: str) -> bool:
+    """Check whether a name can be used as is in generated Python source."""
+    return name.isidentifier() and not keyword.iskeyword(name)
+
+
+def _annotation_source(annotation: Any) -> str:
+    """
+    Render a field annotation as Python source.
+
+    Args:
+        annotation: Builtin type or union of builtin types and None
+
+    Returns:
+        Source of the annotation, e.g. ``int | None``
+    """
+    if annotation is NoneType:
+        return "None"
+    if get_origin(annotation) in (Union, UnionType):
+        return " | ".join(_annotation_source(arg) for arg in get_args(annotation))
+    if annotation is None or getattr(annotation, "__module__", None) != "builtins":
+        raise ModelGenerationError(f"Cannot write annotation {annotation!r}")
+    return str(annotation.__name__)
 
 
 class ModelGenerator:
@@ -14,6 +123,9 @@ class ModelGenerator:
 
     def __init__(self) -> None:
         self.generated_models: dict[str, type[BaseModel]] = {}
+        self.generated_adapters: dict[str, TypeAdapter[list[dict[str, Any]]]] = {}
+        # Field arguments by column type, nullability and default
+        self._field_kwargs_cache: dict[tuple[str, bool, str], dict[str, Any]] = {}
 
     def generate_models_from_database(self) -> dict[str, type[BaseModel]]:
         """
@@ -23,32 +135,231 @@ class ModelGenerator:
             Dictionary mapping table names to Pydantic model classes
         """
         try:
+            # One query for every table's columns instead of a table list
+            # query plus one DESCRIBE per table
             with SchemaExtractor() as extractor:
-                table_names = extractor.get_table_names()
+                tables_columns = self._load_table_columns(extractor)
 
-                models = {}
-                for table_name in table_names:
-                    columns_info = extractor.get_table_columns_info(table_name)
-                    model_class = self._create_pydantic_model(table_name, columns_info)
-                    models[table_name] = model_class
+            models = {}
+            for table_name, columns_info in tables_columns.items():
+                model_class = self._create_pydantic_model(table_name, columns_info)
+                models[table_name] = model_class
 
-                self.generated_models.update(models)
-                return models
+            self._register_models(models)
+            return models
 
         except Exception as e:
             raise ModelGenerationError(
                 f"Failed to generate models from database: {e}"
             ) from e
 
+    def load_models(self) -> dict[str, type[BaseModel]]:
+        """
+        Load the table models from the configured ``schema_source``.
+
+        Returns:
+            Dictionary mapping table names to Pydantic model classes
+        """
+        if settings.schema_source == "module":
+            return self.load_precompiled_models()
+        if settings.schema_source == "cache":
+            return self.load_cached_models()
+        return self.generate_models_from_database()
+
+    def load_cached_models(self) -> dict[str, type[BaseModel]]:
+        """
+        Generate models from the schema cache file without the database.
+
+        The cache is trusted as is; it is written by a ``live`` start with
+        ``schema_cache_path`` set.
+
+        Returns:
+            Dictionary mapping table names to Pydantic model classes
+        """
+        tables_columns = None
+        if settings.schema_cache_path:
+            tables_columns = schema_cache.load(settings.schema_cache_path, None)
+        if tables_columns is None:
+            raise ModelGenerationError(
+                f"No schema cache found at '{settings.schema_cache_path}'"
+            )
+
+        excluded = settings.excluded_tables_set
+        models = {
+            table_name: self._create_pydantic_model(
+                table_name, [ColumnInfo._make(column) for column in columns]
+            )
+            for table_name, columns in tables_columns.items()
+            if table_name not in excluded
+        }
+        self._register_models(models)
+        return models
+
+    def load_precompiled_models(self) -> dict[str, type[BaseModel]]:
+        """
+        Load the models written by ``write_precompiled_models``.
+
+        Importing plain class definitions needs no database round trips.
+
+        Returns:
+            Dictionary mapping table names to Pydantic model classes
+        """
+        try:
+            module = importlib.import_module(PRECOMPILED_MODELS_MODULE)
+        except ImportError as e:
+            raise ModelGenerationError(
+                f"No precompiled models found, run "
+                f"'python -m app.services.model_generator' first: {e}"
+            ) from e
+
+        table_models: dict[str, type[BaseModel]] = module.TABLE_MODELS
+        excluded = settings.excluded_tables_set
+        models = {
+            table_name: model_class
+            for table_name, model_class in table_models.items()
+            if table_name not in excluded
+        }
+        self._register_models(models)
+        return models
+
+    def write_precompiled_models(self, path: Path | None = None) -> Path:
+        """
+        Write the generated models as a Python module of class definitions.
+
+        Args:
+            path: Output file, defaults to the module loaded by
+                ``load_precompiled_models``
+
+        Returns:
+            Path of the written module
+
+        Raises:
+            ModelGenerationError: If two tables map to the same class name, or
+                a model cannot be written as Python source
+        """
+        if path is None:
+            path = Path(__file__).parent.parent / "models" / "tables.py"
+
+        # Table names such as foo_bar and foo__bar give the same class name;
+        # written out, the second class would silently replace the first
+        tables_by_class: dict[str, str] = {}
+        for table_name, model_class in self.generated_models.items():
+            other = tables_by_class.setdefault(model_class.__name__, table_name)
+            if other != table_name:
+                raise ModelGenerationError(
+                    f"Cannot write models for tables '{other}' and "
+                    f"'{table_name}': both map to class {model_class.__name__}"
+                )
+
+        lines = [
+            '"""',
+            "Pydantic models for the database tables.",
+            "",
+            "Generated by 'python -m app.services.model_generator', do not edit.",
+            '"""',
+            "",
+            "from pydantic import BaseModel, Field",
+        ]
+        for model_class in self.generated_models.values():
+            lines += ["", "", *self._render_model(model_class)]
+        lines += ["", "", "TABLE_MODELS: dict[str, type[BaseModel]] = {"]
+        lines += [
+            f"    {table_name!r}: {model_class.__name__},"
+            for table_name, model_class in self.generated_models.items()
+        ]
+        lines.append("}")
+
+        path.write_text("\n".join(lines) + "\n")
+        return path
+
+    def _render_model(self, model_class: type[BaseModel]) -> list[str]:
+        """
+        Render a generated model as the source of a class definition.
+
+        Args:
+            model_class: Pydantic model class
+
+        Returns:
+            Source lines of the class
+        """
+        names = [model_class.__name__, *model_class.model_fields]
+        invalid = [name for name in names if not _is_plain_identifier(name)]
+        if invalid:
+            raise ModelGenerationError(
+                f"Cannot write {model_class.__name__} as Python source, "
+                f"invalid identifiers: {', '.join(invalid)}"
+            )
+
+        lines = [f"class {model_class.__name__}(BaseModel):"]
+        for name, field in model_class.model_fields.items():
+            arguments = []
+            if not field.is_required():
+                arguments.append(f"default={field.default!r}")
+            arguments.append(f"description={field.description!r}")
+            for constraint in field.metadata:
+                if not isinstance(constraint, MaxLen):
+                    raise ModelGenerationError(
+                        f"Cannot write constraint {constraint!r} of "
+                        f"{model_class.__name__}.{name} as Python source"
+                    )
+                arguments.append(f"max_length={constraint.max_length}")
+            annotation = _annotation_source(field.annotation)
+            lines.append(f"    {name}: {annotation} = Field({', '.join(arguments)})")
+        return lines
+
+    def _register_models(self, models: dict[str, type[BaseModel]]) -> None:
+        """
+        Store models and build their list validators.
+
+        Args:
+            models: Dictionary mapping table names to Pydantic model classes
+        """
+        self.generated_models.update(models)
+        # Build list validators once so requests validate rows in batch
+        self.generated_adapters.update(
+            {
+                table_name: self._create_rows_adapter(model_class)
+                for table_name, model_class in models.items()
+            }
+        )
+
+    def _load_table_columns(
+        self, extractor: SchemaExtractor
+    ) -> dict[str, list[ColumnInfo]]:
+        """
+        Get all table columns, from the schema cache file when it is current.
+
+        Args:
+            extractor: Schema extractor with an open connection
+
+        Returns:
+            Dictionary mapping table names to lists of column information
+        """
+        cache_path = settings.schema_cache_path
+        if not cache_path:
+            return extractor.get_all_table_columns()
+
+        fingerprint = extractor.get_schema_fingerprint()
+        cached = schema_cache.load(cache_path, fingerprint)
+        if cached is not None:
+            return {
+                table_name: [ColumnInfo._make(column) for column in columns]
+                for table_name, columns in cached.items()
+            }
+
+        tables_columns = extractor.get_all_table_columns()
+        schema_cache.save(cache_path, fingerprint, tables_columns)
+        return tables_columns
+
     def _create_pydantic_model(
-        self, table_name: str, columns_info: list[dict[str, Any]]
+        self, table_name: str, columns_info: list[ColumnInfo]
     ) -> type[BaseModel]:
         """
         Create a Pydantic model from table column information.
 
         Args:
             table_name: Name of the table
-            columns_info: List of column information dictionaries
+            columns_info: List of column information
 
         Returns:
             Pydantic model class
@@ -57,17 +368,18 @@ class ModelGenerator:
             fields: dict[str, Any] = {}
 
             for column in columns_info:
-                field_name = str(column["Field"])
-                field_type = str(column["Type"])
-                is_nullable = str(column["Null"]) == "YES"
-                default_value = column["Default"]
+                field_name = str(column.field)
+                # Lowercased once, for both the type mapping and constraints
+                type_lower = str(column.type).lower()
+                is_nullable = str(column.null) == "YES"
+                default_value = column.default
 
                 # Map MySQL types to Python types
-                python_type = self._map_mysql_type_to_python(field_type, is_nullable)
+                python_type = _map_mysql_type(type_lower, is_nullable)
 
                 # Create field with constraints
                 field_info = self._create_field_info(
-                    column, python_type, is_nullable, default_value
+                    column, type_lower, python_type, is_nullable, default_value
                 )
                 fields[field_name] = field_info
 
@@ -83,80 +395,45 @@ class ModelGenerator:
                 f"Failed to create model for table {table_name}: {e}"
             ) from e
 
-    def _map_mysql_type_to_python(
-        self, mysql_type: str, is_nullable: bool
-    ) -> type[Any]:
+    def _create_rows_adapter(
+        self, model_class: type[BaseModel]
+    ) -> TypeAdapter[list[dict[str, Any]]]:
         """
-        Map MySQL column type to Python type.
+        Create a list TypeAdapter validating rows against a model's fields.
+
+        Rows are validated as a TypedDict with the same fields and
+        constraints, which yields plain dicts: a response does not build
+        (and keep alive) one model instance per row.
 
         Args:
-            mysql_type: MySQL column type string
-            is_nullable: Whether the column is nullable
+            model_class: Pydantic model class for the table
 
         Returns:
-            Python type
-        """
-        mysql_type_lower = mysql_type.lower()
-
-        # Integer types
-        if any(
-            t in mysql_type_lower
-            for t in ["int", "integer", "bigint", "smallint", "tinyint"]
-        ):
-            # Special case for tinyint(1) which is often used as boolean
-            if "tinyint(1)" in mysql_type_lower:
-                base_type: type[Any] = bool
-            else:
-                base_type = int
-        # Float types
-        elif any(
-            t in mysql_type_lower for t in ["float", "double", "decimal", "numeric"]
-        ):
-            base_type = float
-        # String types
-        elif any(
-            t in mysql_type_lower
-            for t in ["varchar", "char", "text", "longtext", "mediumtext", "tinytext"]
-        ):
-            base_type = str
-        # Date/time types
-        elif any(
-            t in mysql_type_lower for t in ["date", "time", "datetime", "timestamp"]
-        ):
-            base_type = str  # We'll handle these as strings for simplicity
-        # Boolean type
-        elif "boolean" in mysql_type_lower:
-            base_type = bool
-        # JSON type
-        elif "json" in mysql_type_lower:
-            base_type = dict
-        # Binary types
-        elif any(t in mysql_type_lower for t in ["blob", "binary", "varbinary"]):
-            base_type = bytes
-        # Default to string for unknown types
-        else:
-            base_type = str
-
-        # Make optional if nullable - use proper type annotation
-        if is_nullable:
-            # Return the union type properly for mypy
-            return type(
-                base_type.__name__ + " | None", (object,), {"__origin__": base_type}
-            )
-        return base_type
+            TypeAdapter validating and serializing a list of table records
+        """
+        fields = {
+            name: Annotated[(field.annotation, *field.metadata)]
+            if field.metadata
+            else field.annotation
+            for name, field in model_class.model_fields.items()
+        }
+        row_type = TypedDict(model_class.__name__, fields)  # type: ignore[misc]
+        return cast(TypeAdapter[list[dict[str, Any]]], TypeAdapter(list[row_type]))
 
     def _create_field_info(
         self,
-        column: dict[str, Any],
-        python_type: type[Any],
+        column: ColumnInfo,
+        mysql_type_lower: str,
+        python_type: Any,
         is_nullable: bool,
         default_value: Any,
-    ) -> tuple[type[Any], Any]:
+    ) -> tuple[Any, Any]:
         """
         Create field information for Pydantic model.
 
         Args:
-            column: Column information dictionary
+            column: Column information
+            mysql_type_lower: Lowercased MySQL column type string
             python_type: Python type for the field
             is_nullable: Whether the field is nullable
             default_value: Default value for the field
@@ -164,51 +441,47 @@ class ModelGenerator:
         Returns:
             Tuple of (type, Field) for Pydantic model creation
         """
-        field_kwargs: dict[str, Any] = {}
-
-        # Add description
-        field_kwargs["description"] = f"Column: {column['Field']} ({column['Type']})"
-
-        # Handle default values
-        if default_value is not None and default_value != "NULL":
-            # Try to convert default value to appropriate type
-            try:
-                if python_type == int or (
-                    hasattr(python_type, "__origin__")
-                    and python_type.__args__[0] == int
-                ):
-                    converted_default: Any = int(default_value)
-                elif python_type == float or (
-                    hasattr(python_type, "__origin__")
-                    and python_type.__args__[0] == float
-                ):
-                    converted_default = float(default_value)
-                elif python_type == bool or (
-                    hasattr(python_type, "__origin__")
-                    and python_type.__args__[0] == bool
-                ):
-                    converted_default = bool(int(default_value))
-                else:
-                    converted_default = str(default_value)
-                field_kwargs["default"] = converted_default
-            except (ValueError, TypeError):
-                # If conversion fails, use string representation
-                field_kwargs["default"] = str(default_value)
-        elif is_nullable:
-            field_kwargs["default"] = None
-
-        # Add constraints based on column type
-        if "varchar" in str(column["Type"]).lower():
+        # Columns of the same shape share everything but the description
+        key = (mysql_type_lower, is_nullable, repr(default_value))
+        shared_kwargs = self._field_kwargs_cache.get(key)
+        if shared_kwargs is None:
+            shared_kwargs = {}
+
+            # Handle default values
+            if default_value is not None and default_value != "NULL":
+                # Try to convert default value to appropriate type, looking
+                # through the union with None of nullable columns
+                base_type = next(
+                    (arg for arg in get_args(python_type) if arg is not NoneType),
+                    python_type,
+                )
+                try:
+                    if base_type is int:
+                        converted_default: Any = int(default_value)
+                    elif base_type is float:
+                        converted_default = float(default_value)
+                    elif base_type is bool:
+                        converted_default = bool(int(default_value))
+                    else:
+                        converted_default = str(default_value)
+                    shared_kwargs["default"] = converted_default
+                except (ValueError, TypeError):
+                    # If conversion fails, use string representation
+                    shared_kwargs["default"] = str(default_value)
+            elif is_nullable:
+                shared_kwargs["default"] = None
+
+            # Add constraints based on column type
             # Extract length from varchar(n)
-            try:
-                match = re.search(r"varchar\((\d+)\)", str(column["Type"]).lower())
-                if match:
-                    max_length = int(match.group(1))
-                    field_kwargs["max_length"] = max_length
-            except Exception:
-                pass
+            match = _VARCHAR_RE.match(mysql_type_lower)
+            if match:
+                shared_kwargs["max_length"] = int(match.group(1))
+
+            self._field_kwargs_cache[key] = shared_kwargs
 
-        return (python_type, Field(**field_kwargs))
+        # Add description
+        description = f"Column: {column.field} ({column.type})"
+        return (python_type, Field(description=description, **shared_kwargs))
 
     def _table_name_to_class_name(self, table_name: str) -> str:
         """
@@ -237,6 +510,23 @@ class ModelGenerator:
 
         return self.generated_models[table_name]
 
+    def get_adapter_for_table(
+        self, table_name: str
+    ) -> TypeAdapter[list[dict[str, Any]]]:
+        """
+        Get the list TypeAdapter for a specific table.
+
+        Args:
+            table_name: Name of the table
+
+        Returns:
+            TypeAdapter validating and serializing a list of table records
+        """
+        if table_name not in self.generated_adapters:
+            raise ModelGenerationError(f"No model found for table: {table_name}")
+
+        return self.generated_adapters[table_name]
+
     def get_all_models(self) -> dict[str, type[BaseModel]]:
         """
         Get all generated models.
@@ -249,3 +539,9 @@ class ModelGenerator:
 
 # Global model generator instance
 model_generator = ModelGenerator()
+
+
+if __name__ == "__main__":
+    model_generator.generate_models_from_database()
+    output = model_generator.write_precompiled_models()
+    print(f"Wrote {len(model_generator.generated_models)} models to {output}")
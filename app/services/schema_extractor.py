@@ -1,23 +1,60 @@
 """Database schema extraction utilities."""
 
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
 
 from mysql.connector import Error
 
 from app.core.config import settings
-from app.core.database import get_db_connection
+from app.core.database import get_db_connection, quote_identifier
 from app.core.exceptions import DatabaseConnectionError, SchemaExtractionError
 
 if TYPE_CHECKING:
-    from mysql.connector.abstracts import MySQLConnectionAbstract
+    from mysql.connector.abstracts import MySQLConnectionAbstract, MySQLCursorAbstract
     from mysql.connector.pooling import PooledMySQLConnection
 
 
+class ColumnInfo(NamedTuple):
+    """Column metadata in the shape of a ``DESCRIBE`` row."""
+
+    field: str
+    type: str
+    null: str
+    key: str
+    default: Any
+    extra: str
+
+
+# Column metadata selected from information_schema, so the table name can be
+# passed as a parameter (unlike with DESCRIBE)
+_COLUMNS_QUERY = (
+    "SELECT table_name, column_name, column_type, is_nullable, "
+    "column_key, column_default, extra "
+    "FROM information_schema.columns "
+    "WHERE table_schema = %s"
+)
+
+
+def _exclusion_filter() -> tuple[str, tuple[str, ...]]:
+    """
+    Build the SQL condition that leaves out the excluded tables.
+
+    Returns:
+        Condition to append to a WHERE clause (empty if nothing is excluded)
+        and its parameters
+    """
+    excluded = tuple(sorted(settings.excluded_tables_set))
+    if not excluded:
+        return "", ()
+    placeholders = ", ".join(["%s"] * len(excluded))
+    return f" AND table_name NOT IN ({placeholders})", excluded
+
+
 class SchemaExtractor:
     """Extracts database schema information for model generation."""
 
     def __init__(self) -> None:
         self.connection: "PooledMySQLConnection | MySQLConnectionAbstract | None" = None
+        self._cursor: "MySQLCursorAbstract | None" = None
 
     def __enter__(self) -> "SchemaExtractor":
         self.connection = get_db_connection()
@@ -26,8 +63,39 @@ class SchemaExtractor:
         return self
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        if self.connection and self.connection.is_connected():
-            self.connection.close()
+        # Close without probing the connection first: a dead connection
+        # fails to close, which must not mask the error of the with block
+        try:
+            if self._cursor is not None:
+                self._cursor.close()
+        except Error:
+            pass
+        finally:
+            self._cursor = None
+        # Always close: for pooled connections this returns them to the pool
+        try:
+            if self.connection is not None:
+                self.connection.close()
+        except Error:
+            pass
+        finally:
+            self.connection = None
+
+    def _get_cursor(self) -> "MySQLCursorAbstract":
+        """
+        Get the cursor shared by all queries of this extractor.
+
+        The cursor is buffered, so every result is fully read and the cursor
+        can run the next query straight away.
+
+        Returns:
+            Buffered tuple cursor
+        """
+        if self.connection is None:
+            raise DatabaseConnectionError("No database connection available")
+        if self._cursor is None:
+            self._cursor = self.connection.cursor(buffered=True)
+        return self._cursor
 
     def get_table_names(self) -> list[str]:
         """
@@ -36,29 +104,80 @@ class SchemaExtractor:
         Returns:
             List of table names
         """
-        if self.connection is None:
-            raise DatabaseConnectionError("No database connection available")
-
         try:
-            cursor = self.connection.cursor()
+            # Excluded tables are filtered by the server, so their names
+            # are never sent
+            condition, excluded = _exclusion_filter()
+            cursor = self._get_cursor()
             cursor.execute(
-                f"SELECT table_name FROM information_schema.tables "
-                f"WHERE table_schema = '{settings.db_name}'"
+                "SELECT table_name FROM information_schema.tables "
+                f"WHERE table_schema = %s{condition}",
+                (settings.db_name, *excluded),
             )
             results = cursor.fetchall()
-            # Cast to handle MySQL connector's complex return types
-            # MySQL connector returns tuples when using regular cursor
-            all_tables = [str(cast(tuple[Any, ...], row)[0]) for row in results]
 
-            # Filter out excluded tables
-            excluded = settings.excluded_tables_list
-            tables = [table for table in all_tables if table not in excluded]
+            # Cast to handle MySQL connector's complex return types. str()
+            # stays: some servers send information_schema names as bytes.
+            return [str(row[0]) for row in cast(list[tuple[Any, ...]], results)]
+
+        except Error as e:
+            raise SchemaExtractionError(f"Failed to get table names: {e}") from e
+
+    def get_schema_fingerprint(self) -> str:
+        """
+        Get a fingerprint of the column definitions of all tables.
+
+        The server reduces the column metadata to a checksum, so only one row
+        comes back. The fingerprint changes whenever a column, table or the
+        excluded tables setting changes.
+
+        Returns:
+            Fingerprint string
+        """
+        try:
+            cursor = self._get_cursor()
+            cursor.execute(
+                "SELECT COUNT(*), COALESCE(SUM(CRC32(CONCAT_WS('|', table_name, "
+                "ordinal_position, column_name, column_type, is_nullable, "
+                "column_key, COALESCE(column_default, 'NULL'), extra))), 0) "
+                "FROM information_schema.columns "
+                "WHERE table_schema = %s",
+                (settings.db_name,),
+            )
+            row = cast(tuple[Any, ...], cursor.fetchone())
+
+            excluded = ",".join(sorted(settings.excluded_tables_set))
+            return f"{settings.db_name}:{row[0]}:{row[1]}:{excluded}"
+
+        except Error as e:
+            raise SchemaExtractionError(f"Failed to fingerprint schema: {e}") from e
+
+    def get_all_table_columns(self) -> dict[str, list[ColumnInfo]]:
+        """
+        Get column information for all non-excluded tables in one query.
+
+        Columns are listed in ordinal order.
 
-            cursor.close()
+        Returns:
+            Dictionary mapping table names to lists of column information
+        """
+        try:
+            condition, excluded = _exclusion_filter()
+            cursor = self._get_cursor()
+            cursor.execute(
+                f"{_COLUMNS_QUERY}{condition} ORDER BY table_name, ordinal_position",
+                (settings.db_name, *excluded),
+            )
+            results = cursor.fetchall()
+
+            tables: dict[str, list[ColumnInfo]] = {}
+            # Cast to handle MySQL connector's complex return types
+            for row in cast(list[tuple[Any, ...]], results):
+                tables.setdefault(str(row[0]), []).append(ColumnInfo(*row[1:]))
             return tables
 
         except Error as e:
-            raise SchemaExtractionError(f"Failed to get table names: {e}") from e
+            raise SchemaExtractionError(f"Failed to get table columns: {e}") from e
 
     def get_table_schema_ddl(self, table_name: str) -> str:
         """
@@ -70,14 +189,10 @@ class SchemaExtractor:
         Returns:
             CREATE TABLE DDL statement
         """
-        if self.connection is None:
-            raise DatabaseConnectionError("No database connection available")
-
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(f"SHOW CREATE TABLE {table_name}")
+            cursor = self._get_cursor()
+            cursor.execute(f"SHOW CREATE TABLE {quote_identifier(table_name)}")
             result = cursor.fetchone()
-            cursor.close()
 
             if result:
                 # Cast to handle MySQL connector's complex return types
@@ -101,15 +216,31 @@ class SchemaExtractor:
             Combined DDL statements for all tables
         """
         tables = self.get_table_names()
-        ddl_statements = []
+        if not tables:
+            return ""
 
-        for table in tables:
-            ddl = self.get_table_schema_ddl(table)
-            ddl_statements.append(ddl)
+        try:
+            cursor = self._get_cursor()
+            # Send every SHOW CREATE TABLE in one round trip; each statement
+            # produces its own result set
+            cursor.execute(
+                ";".join(
+                    f"SHOW CREATE TABLE {quote_identifier(table)}" for table in tables
+                )
+            )
+            ddl_statements: list[str] = []
+            while True:
+                # Cast to handle MySQL connector's complex return types
+                rows = cast(list[tuple[Any, ...]], cursor.fetchall())
+                ddl_statements.extend(str(row[1]) for row in rows)
+                if not cursor.nextset():
+                    break
+        except Error as e:
+            raise SchemaExtractionError(f"Failed to get table schemas: {e}") from e
 
         return "\n\n".join(ddl_statements)
 
-    def get_table_columns_info(self, table_name: str) -> list[dict[str, Any]]:
+    def get_table_columns_info(self, table_name: str) -> list[ColumnInfo]:
         """
         Get detailed column information for a table.
 
@@ -117,20 +248,23 @@ class SchemaExtractor:
             table_name: Name of the table
 
         Returns:
-            List of column information dictionaries
+            List of column information
         """
-        if self.connection is None:
-            raise DatabaseConnectionError("No database connection available")
-
         try:
-            cursor = self.connection.cursor(dictionary=True)
-            cursor.execute(f"DESCRIBE {table_name}")
+            cursor = self._get_cursor()
+            cursor.execute(
+                f"{_COLUMNS_QUERY} AND table_name = %s ORDER BY ordinal_position",
+                (settings.db_name, table_name),
+            )
             results = cursor.fetchall()
-            cursor.close()
+
+            if not results:
+                raise SchemaExtractionError(f"No columns found for table {table_name}")
 
             # Cast to handle MySQL connector's complex return types
-            # When using dictionary=True, MySQL connector returns list of dicts
-            return cast(list[dict[str, Any]], results)
+            return [
+                ColumnInfo(*row[1:]) for row in cast(list[tuple[Any, ...]], results)
+            ]
 
         except Error as e:
             raise SchemaExtractionError(
@@ -1,9 +1,37 @@
 """Pytest configuration and fixtures."""
 
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
+
 import pytest
 from fastapi.testclient import TestClient
 
+from app.api import cache, dependencies, endpoints
+from app.core import breaker, schema_cache
+from app.core.config import settings
 from app.main import create_app
+from app.services.model_generator import ModelGenerator
+
+# Columns of the fake tables served by table_app, as information_schema
+# rows (``health`` collides with the health check route)
+FAKE_TABLES = {
+    "things": [
+        ["id", "int", "NO", "PRI", None, ""],
+        ["name", "varchar(50)", "NO", "", None, ""],
+    ],
+    "health": [["id", "int", "NO", "PRI", None, ""]],
+}
+
+
+class FakeClock:
+    """Stand-in for time.monotonic that only moves when told to."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
 
 
 @pytest.fixture
@@ -19,7 +47,61 @@ def client(app):
 
 
 @pytest.fixture
-def mock_db_connection():
-    """Mock database connection for testing."""
-    # This would be implemented with proper mocking
-    # when actual tests are written
+def mock_db_connection(app):
+    """Mock database connection injected into the table endpoints."""
+    connection = MagicMock()
+    app.dependency_overrides[dependencies.get_database_connection] = lambda: connection
+    yield connection
+    app.dependency_overrides.pop(dependencies.get_database_connection, None)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock of the circuit breaker and the response cache."""
+    fake = FakeClock()
+    # Patch the modules' view of time only; the event loop keeps real time
+    for module in (breaker, cache):
+        monkeypatch.setattr(module, "time", SimpleNamespace(monotonic=fake))
+    return fake
+
+
+@pytest.fixture
+def cached_schema(tmp_path, monkeypatch):
+    """
+    Serve table columns from a schema cache file, as with SCHEMA_SOURCE=cache.
+
+    Returns:
+        Function taking a dictionary of table names to column rows
+    """
+
+    def use(tables: dict[str, list[list[Any]]]) -> None:
+        cache_path = tmp_path / "schema.json"
+        schema_cache.save(str(cache_path), "test", tables)
+        monkeypatch.setattr(settings, "schema_source", "cache")
+        monkeypatch.setattr(settings, "schema_cache_path", str(cache_path))
+
+    return use
+
+
+@pytest.fixture
+def table_app(app, mock_db_connection, cached_schema, monkeypatch):
+    """
+    App with endpoints for FAKE_TABLES, reading rows from mock_db_connection.
+
+    The models are loaded from a schema cache file by a generator of their
+    own.
+    """
+    cached_schema(FAKE_TABLES)
+    monkeypatch.setattr(settings, "table_cache_ttl", 5.0)
+    monkeypatch.setattr(settings, "table_cache_stale_ttl", 60.0)
+    monkeypatch.setattr(endpoints, "model_generator", ModelGenerator())
+    monkeypatch.setattr(endpoints, "_schema_cache", {})
+
+    endpoints.create_dynamic_endpoints(app)
+    cache.response_cache.invalidate()
+    yield app
+    cache.response_cache.invalidate()
+    cache.response_cache.paths.difference_update(
+        {f"/{table}" for table in FAKE_TABLES}
+        | {f"/{table}/count" for table in FAKE_TABLES}
+    )
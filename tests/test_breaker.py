@@ -0,0 +1,102 @@
+"""Tests for the database circuit breaker."""
+
+import pytest
+
+from app.core import database
+from app.core.breaker import CircuitBreaker
+
+
+def test_closed_allows_attempts_below_threshold(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10.0)
+
+    for _ in range(2):
+        assert breaker.allow()
+        breaker.record_failure()
+
+    assert breaker.state == "closed"
+    assert breaker.allow()
+
+
+def test_success_resets_failure_count(clock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10.0)
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state == "closed"
+    assert breaker.failures == 1
+
+
+def test_opens_at_threshold_and_rejects_until_timeout(clock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10.0)
+
+    breaker.record_failure()
+    breaker.record_failure()
+
+    assert breaker.state == "open"
+    assert not breaker.allow()
+    clock.now += 9.9
+    assert not breaker.allow()
+
+
+def test_half_open_lets_a_single_probe_through(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10.0)
+    breaker.record_failure()
+
+    clock.now += 10.0
+
+    assert breaker.allow()
+    assert breaker.state == "half_open"
+    # The probe is still in flight
+    assert not breaker.allow()
+
+
+def test_half_open_probe_success_closes(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10.0)
+    breaker.record_failure()
+    clock.now += 10.0
+    breaker.allow()
+
+    breaker.record_success()
+
+    assert breaker.state == "closed"
+    assert breaker.failures == 0
+    assert breaker.allow()
+
+
+def test_half_open_probe_failure_reopens(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10.0)
+    for _ in range(3):
+        breaker.record_failure()
+    clock.now += 10.0
+    breaker.allow()
+
+    breaker.record_failure()
+
+    assert breaker.state == "open"
+    assert breaker.opened_at == clock.now
+    assert not breaker.allow()
+    clock.now += 10.0
+    assert breaker.allow()
+
+
+def test_checkout_records_failures_other_than_mysql_errors(clock, monkeypatch):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10.0)
+    breaker.record_failure()
+    clock.now += 10.0
+    monkeypatch.setattr(database, "_breaker", breaker)
+
+    def broken_pool():
+        raise ImportError("C extension not available")
+
+    monkeypatch.setattr(database, "get_pool", broken_pool)
+
+    with pytest.raises(ImportError):
+        database.checkout_connection()
+
+    # The failed half-open probe reopened the breaker instead of leaving it
+    # half-open, so a later attempt is let through after the timeout
+    assert breaker.state == "open"
+    clock.now += 10.0
+    assert breaker.allow()
@@ -0,0 +1,139 @@
+"""Tests for the response cache of the table endpoints."""
+
+import anyio
+import httpx
+import pytest
+from mysql.connector import Error
+
+from app.api.cache import ResponseCache
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def serve_rows(connection, rows):
+    """Make every query on the mock connection return ``rows``."""
+    cursor = connection.cursor.return_value
+
+    def execute(sql, params):
+        batches = iter([rows, []])
+        cursor.fetchmany.side_effect = lambda size: next(batches)
+
+    cursor.execute.side_effect = execute
+    return cursor
+
+
+def client_for(app):
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    )
+
+
+@pytest.mark.anyio
+async def test_fresh_response_is_served_from_cache(
+    table_app, mock_db_connection, clock
+):
+    cursor = serve_rows(mock_db_connection, [(1, "a")])
+
+    async with client_for(table_app) as client:
+        first = await client.get("/things")
+        serve_rows(mock_db_connection, [(2, "b")])
+        clock.now += 5.0
+        second = await client.get("/things")
+
+    assert first.json() == [{"id": 1, "name": "a"}]
+    assert second.json() == first.json()
+    assert cursor.execute.call_count == 1
+
+
+@pytest.mark.anyio
+async def test_query_parameter_order_shares_an_entry(
+    table_app, mock_db_connection, clock
+):
+    cursor = serve_rows(mock_db_connection, [(1, "a")])
+
+    async with client_for(table_app) as client:
+        await client.get("/things?offset=0&limit=10")
+        await client.get("/things?limit=10&offset=0")
+        await client.get("/things?limit=20&offset=0")
+
+    assert cursor.execute.call_count == 2
+
+
+@pytest.mark.anyio
+async def test_stale_response_is_served_while_refreshing(
+    table_app, mock_db_connection, clock
+):
+    cursor = serve_rows(mock_db_connection, [(1, "a")])
+
+    async with client_for(table_app) as client:
+        await client.get("/things")
+        serve_rows(mock_db_connection, [(2, "b")])
+        clock.now += 6.0
+        stale = await client.get("/things")
+
+        # Let the background refresh finish
+        for _ in range(20):
+            if cursor.execute.call_count == 2:
+                break
+            await anyio.sleep(0.01)
+        await anyio.sleep(0.01)
+        refreshed = await client.get("/things")
+
+    assert stale.json() == [{"id": 1, "name": "a"}]
+    assert refreshed.json() == [{"id": 2, "name": "b"}]
+    assert cursor.execute.call_count == 2
+
+
+@pytest.mark.anyio
+async def test_expired_response_is_fetched_again(table_app, mock_db_connection, clock):
+    cursor = serve_rows(mock_db_connection, [(1, "a")])
+
+    async with client_for(table_app) as client:
+        await client.get("/things")
+        serve_rows(mock_db_connection, [(2, "b")])
+        clock.now += 65.1
+        expired = await client.get("/things")
+
+    assert expired.json() == [{"id": 2, "name": "b"}]
+    assert cursor.execute.call_count == 2
+
+
+@pytest.mark.anyio
+async def test_only_successful_responses_are_stored(
+    table_app, mock_db_connection, clock
+):
+    cursor = mock_db_connection.cursor.return_value
+    cursor.execute.side_effect = Error("boom")
+
+    async with client_for(table_app) as client:
+        failed = await client.get("/things")
+        serve_rows(mock_db_connection, [(1, "a")])
+        succeeded = await client.get("/things")
+
+    assert failed.status_code == 500
+    assert succeeded.json() == [{"id": 1, "name": "a"}]
+
+
+def test_cache_evicts_oldest_entries_over_the_byte_limit(clock):
+    cache = ResponseCache(max_bytes=10, max_entry_bytes=10)
+
+    cache.set("/a?", [], b"aaaa")
+    cache.set("/b?", [], b"bbbb")
+    cache.set("/c?", [], b"cccc")
+
+    assert cache.get("/a?") is None
+    assert cache.get("/b?") is not None
+    assert cache.get("/c?") is not None
+
+
+def test_cache_skips_bodies_over_the_entry_limit(clock):
+    cache = ResponseCache(max_bytes=100, max_entry_bytes=4)
+    cache.set("/a?", [], b"aaaa")
+
+    cache.set("/a?", [], b"aaaaa")
+
+    # The oversized body replaced nothing: the outdated entry is gone too
+    assert cache.get("/a?") is None
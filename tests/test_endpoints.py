@@ -0,0 +1,66 @@
+"""Tests for the dynamic table endpoints."""
+
+import pytest
+
+from app.api import dependencies, endpoints
+from app.core.config import settings
+from app.core.exceptions import DatabaseUnavailableError
+
+
+def test_tables_lists_only_tables_with_an_endpoint(table_app, client):
+    # A second call registers nothing new and keeps the list
+    endpoints.create_dynamic_endpoints(table_app)
+
+    tables = client.get("/tables").json()
+    assert tables["total_tables"] == 1
+    assert [table["endpoint"] for table in tables["tables"]] == ["/things"]
+    paths = [getattr(route, "path", None) for route in table_app.router.routes]
+    assert paths.count("/things") == 1
+    # The health table did not shadow the health check
+    assert paths.count("/health") == 1
+
+
+def test_count_returns_the_table_statistics_estimate(
+    table_app, mock_db_connection, client
+):
+    cursor = mock_db_connection.cursor.return_value
+    cursor.fetchone.return_value = (42,)
+
+    response = client.get("/things/count")
+
+    assert response.json() == {"table_name": "things", "estimated_rows": 42}
+    assert cursor.execute.call_args.args[1][1] == "things"
+
+
+def test_count_is_null_without_an_estimate(table_app, mock_db_connection, client):
+    mock_db_connection.cursor.return_value.fetchone.return_value = (None,)
+
+    response = client.get("/things/count")
+
+    assert response.json() == {"table_name": "things", "estimated_rows": None}
+
+
+def test_count_of_a_table_without_an_endpoint_is_not_found(table_app, client):
+    assert client.get("/secrets/count").status_code == 404
+
+
+def test_count_is_unavailable_without_a_free_connection(table_app, client):
+    def exhausted():
+        raise DatabaseUnavailableError()
+
+    table_app.dependency_overrides[dependencies.get_database_connection] = exhausted
+
+    response = client.get("/things/count")
+
+    assert response.status_code == 503
+
+
+@pytest.mark.parametrize(
+    "query",
+    ["limit=0", f"limit={settings.max_page_size + 1}", "offset=-1"],
+)
+def test_page_outside_bounds_is_rejected(table_app, mock_db_connection, client, query):
+    response = client.get(f"/things?{query}")
+
+    assert response.status_code == 422
+    mock_db_connection.cursor.assert_not_called()
@@ -0,0 +1,29 @@
+"""Tests for application startup and shutdown."""
+
+import time
+
+from fastapi.testclient import TestClient
+
+from app import main
+from app.core.config import settings
+
+
+def test_shutdown_is_prompt_while_database_is_down(app, monkeypatch):
+    probes = []
+
+    def database_down() -> bool:
+        probes.append(time.monotonic())
+        time.sleep(0.05)
+        return False
+
+    monkeypatch.setattr(main, "database_available", database_down)
+    monkeypatch.setattr(settings, "schema_source", "live")
+
+    with TestClient(app) as client:
+        assert client.get("/health").status_code == 503
+        time.sleep(0.3)
+        started = time.monotonic()
+    elapsed = time.monotonic() - started
+
+    assert len(probes) > 1
+    assert elapsed < 1.0
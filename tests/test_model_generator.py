@@ -0,0 +1,53 @@
+"""Tests for model generation and precompiled models."""
+
+import importlib.util
+
+import pytest
+
+from app.core.exceptions import ModelGenerationError
+from app.services.model_generator import ModelGenerator
+
+
+def import_file(path):
+    spec = importlib.util.spec_from_file_location("generated_tables", path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_precompiled_models_match_generated_schemas(cached_schema, tmp_path):
+    cached_schema(
+        {
+            "order_items": [
+                ["id", "int(11) unsigned", "NO", "PRI", None, "auto_increment"],
+                ["sku", "varchar(32)", "NO", "", None, ""],
+                ["note", "text", "YES", "", None, ""],
+                ["quantity", "int", "NO", "", "1", ""],
+                ["price", "decimal(10,2)", "YES", "", "0.00", ""],
+                ["active", "tinyint(1)", "NO", "", "1", ""],
+                ["created", "datetime", "YES", "", None, ""],
+            ],
+            "users": [["name", "varchar(50)", "NO", "", "anonymous", ""]],
+        }
+    )
+    generator = ModelGenerator()
+    models = generator.load_models()
+
+    module = import_file(generator.write_precompiled_models(tmp_path / "tables.py"))
+
+    assert module.TABLE_MODELS.keys() == models.keys()
+    for table_name, model_class in models.items():
+        written = module.TABLE_MODELS[table_name]
+        assert written.model_json_schema() == model_class.model_json_schema()
+
+
+def test_precompiled_models_reject_colliding_class_names(cached_schema, tmp_path):
+    columns = [["id", "int", "NO", "PRI", None, ""]]
+    cached_schema({"foo_bar": columns, "foo__bar": columns})
+    generator = ModelGenerator()
+    generator.load_models()
+
+    with pytest.raises(ModelGenerationError, match="FooBar"):
+        generator.write_precompiled_models(tmp_path / "tables.py")
+    assert not (tmp_path / "tables.py").exists()
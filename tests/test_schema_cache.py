@@ -0,0 +1,61 @@
+"""Tests for the on-disk schema cache."""
+
+import json
+from unittest.mock import MagicMock
+
+from app.core import schema_cache
+from app.core.config import settings
+from app.services.schema_extractor import SchemaExtractor
+
+TABLES = {"things": [["id", "int", "NO", "PRI", None, "auto_increment"]]}
+
+
+def test_saved_columns_load_for_the_same_fingerprint(tmp_path):
+    path = str(tmp_path / "schema.json")
+    schema_cache.save(path, "db:1:42:", TABLES)
+
+    assert schema_cache.load(path, "db:1:42:") == TABLES
+
+
+def test_load_without_fingerprint_accepts_any_schema(tmp_path):
+    path = str(tmp_path / "schema.json")
+    schema_cache.save(path, "db:1:42:", TABLES)
+
+    assert schema_cache.load(path, None) == TABLES
+
+
+def test_stale_fingerprint_is_ignored(tmp_path):
+    path = str(tmp_path / "schema.json")
+    schema_cache.save(path, "db:1:42:", TABLES)
+
+    assert schema_cache.load(path, "db:2:43:") is None
+
+
+def test_other_format_is_ignored(tmp_path, monkeypatch):
+    path = str(tmp_path / "schema.json")
+    monkeypatch.setattr(schema_cache, "_FORMAT", 1)
+    schema_cache.save(path, "db:1:42:", TABLES)
+    monkeypatch.undo()
+
+    assert json.loads((tmp_path / "schema.json").read_text())["format"] == 1
+    assert schema_cache.load(path, "db:1:42:") is None
+
+
+def test_missing_or_unreadable_file_is_ignored(tmp_path):
+    path = tmp_path / "schema.json"
+    assert schema_cache.load(str(path), None) is None
+
+    path.write_text("{not json")
+    assert schema_cache.load(str(path), None) is None
+
+
+def test_fingerprint_covers_excluded_tables(monkeypatch):
+    monkeypatch.setattr(settings, "db_name", "shop")
+    monkeypatch.setattr(
+        settings, "excluded_tables_set", frozenset({"secrets", "audit"})
+    )
+    extractor = SchemaExtractor()
+    extractor.connection = MagicMock()
+    extractor.connection.cursor.return_value.fetchone.return_value = (3, 1234)
+
+    assert extractor.get_schema_fingerprint() == "shop:3:1234:audit,secrets"